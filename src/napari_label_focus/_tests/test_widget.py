@@ -1,10 +1,20 @@
+import sys
+import types
+
 import numpy as np
+import pandas as pd
+import pytest
 
 from napari_label_focus import TableWidget
+from napari_label_focus import _widget
+from napari_label_focus._widget import _PropertiesTableModel, _region_properties
 from skimage.morphology import label
 from skimage.draw import disk
+from skimage.measure import regionprops_table
+from qtpy.QtCore import Qt
+from qtpy.QtWidgets import QTableView
 
-def test_example_q_widget(make_napari_viewer, capsys):
+def test_example_q_widget(make_napari_viewer, qtbot):
     viewer = make_napari_viewer()
 
     test_labels = np.zeros((1000, 1800))
@@ -19,5 +29,230 @@ def test_example_q_widget(make_napari_viewer, capsys):
 
     my_widget = TableWidget(viewer)
 
-    assert len(my_widget.table._table) == len(np.unique(test_labels)) - 1
+    # The properties are computed in a background thread
+    qtbot.waitUntil(lambda: my_widget.df is not None)
+    qtbot.waitUntil(my_widget._table.isEnabled)
+
+    assert my_widget._table.model().rowCount() == len(np.unique(test_labels)) - 1
+
+
+def _assert_table_matches_labels(df, labels):
+    if labels.ndim == 2:
+        labels = labels[None]  # Measured as a single plane by the widget
+    expected = regionprops_table(labels, properties=["label", "area", "bbox"])
+    df = df.sort_values(by="label")
+    assert df["label"].tolist() == expected["label"].tolist()
+    assert df["volume"].tolist() == expected["area"].tolist()
+    for k in range(6):
+        assert df[f"bbox-{k}"].tolist() == expected[f"bbox-{k}"].tolist()
+
+
+@pytest.mark.parametrize("ndim", [2, 3])
+def test_table_updated_on_paint(make_napari_viewer, qtbot, monkeypatch, ndim):
+    viewer = make_napari_viewer()
+
+    test_labels = np.zeros((20, 50, 60), dtype=np.uint16)
+    test_labels[2:5, 3:10, 4:20] = 1
+    test_labels[10:15, 20:40, 30:50] = 2
+    if ndim == 2:
+        test_labels = test_labels[3] + test_labels[12]
+    layer = viewer.add_labels(test_labels)
+
+    # Count the full computations of the properties
+    n_computations = []
+    compute_properties = TableWidget._compute_properties
+    def counting_compute_properties(self, labels):
+        n_computations.append(1)
+        return compute_properties(self, labels)
+    monkeypatch.setattr(TableWidget, "_compute_properties", counting_compute_properties)
+
+    my_widget = TableWidget(viewer)
+    qtbot.waitUntil(lambda: my_widget.df is not None)
+    initial_df = my_widget.df
+    assert len(n_computations) == 1
+
+    layer.paint((12, 30, 5)[-ndim:], 3)
+    layer.fill((3, 8, 15)[-ndim:], 4)
+    qtbot.waitUntil(lambda: my_widget.df is not initial_df)
+
+    _assert_table_matches_labels(my_widget.df, layer.data)
+    # Only the painted labels were measured again
+    assert len(n_computations) == 1
+    assert my_widget._table.isEnabled()
+
+
+def test_region_properties_match_regionprops():
+    rng = np.random.default_rng(0)
+    test_labels = label(rng.random((30, 40, 50)) > 0.7).astype(np.uint16)
+    test_labels[test_labels == 3] = 0  # Missing label values are skipped
+
+    expected = regionprops_table(test_labels, properties=["label", "area", "bbox"])
+    properties = _region_properties(test_labels)
+    for key, values in expected.items():
+        assert np.array_equal(properties[key], values)
+
+    # Negative values of signed labels are ignored
+    signed_labels = test_labels.astype(np.int32)
+    signed_labels[signed_labels == 5] = -1
+
+    expected = regionprops_table(signed_labels, properties=["label", "area", "bbox"])
+    properties = _region_properties(signed_labels)
+    for key, values in expected.items():
+        assert np.array_equal(properties[key], values)
+
+
+def _stub_gpu_modules(monkeypatch, is_available, regionprops_table):
+    cupy = types.ModuleType("cupy")
+    cupy.cuda = types.SimpleNamespace(is_available=lambda: is_available)
+    cupy.asarray = cupy.asnumpy = np.asarray
+    monkeypatch.setitem(sys.modules, "cupy", cupy)
+
+    cucim = types.ModuleType("cucim")
+    cucim.skimage = types.ModuleType("cucim.skimage")
+    cucim.skimage.measure = types.ModuleType("cucim.skimage.measure")
+    cucim.skimage.measure.regionprops_table = regionprops_table
+    for module in (cucim, cucim.skimage, cucim.skimage.measure):
+        monkeypatch.setitem(sys.modules, module.__name__, module)
+
+
+def _failing_regionprops_table(*args, **kwargs):
+    raise RuntimeError("Kernel compilation failed")
+
+
+@pytest.mark.parametrize(
+    "gpu",
+    ["not installed", "no device", "failing", "float areas"],
+)
+def test_compute_properties_gpu_fallback(make_napari_viewer, monkeypatch, gpu):
+    if gpu == "not installed":
+        monkeypatch.setitem(sys.modules, "cupy", None)  # Makes the import fail
+    elif gpu == "no device":
+        _stub_gpu_modules(monkeypatch, False, _failing_regionprops_table)
+    elif gpu == "failing":
+        _stub_gpu_modules(monkeypatch, True, _failing_regionprops_table)
+    else:
+        _stub_gpu_modules(monkeypatch, True, regionprops_table)  # Returns float areas, like cuCIM
+    monkeypatch.setattr(_widget, "_GPU_MIN_SIZE", 0)
+
+    test_labels = np.zeros((20, 50, 60), dtype=np.uint16)
+    test_labels[2:5, 3:10, 4:20] = 1
+    test_labels[10:15, 20:40, 30:50] = 2
+
+    my_widget = TableWidget(make_napari_viewer())
+    df = my_widget._compute_properties(test_labels)
+
+    _assert_table_matches_labels(df, test_labels)
+    assert np.issubdtype(df["volume"].dtype, np.integer)
+
+
+def test_table_model_fetches_rows_in_batches(qtbot):
+    model = _PropertiesTableModel(["label", "volume"])
+    n_rows = 2 * model.fetch_size + 200
+    model.set_dataframe(pd.DataFrame({"label": np.arange(1, n_rows + 1), "volume": np.ones(n_rows, dtype=int)}))
+
+    assert model.rowCount() == model.fetch_size
+    while model.canFetchMore():
+        model.fetchMore()
+        assert model.rowCount() <= n_rows
+    assert model.rowCount() == n_rows
+
+    model.set_dataframe(None)
+    assert model.rowCount() == 0
+    assert not model.canFetchMore()
+
+
+def test_table_model_sort(qtbot):
+    df = pd.DataFrame({"label": [1, 2, 3, 4, 5, 6], "volume": [2, 5, 2, 7, 5, 1]})
+
+    model = _PropertiesTableModel(["label", "volume"])
+    model.set_dataframe(df)
+    model.sort(1, Qt.SortOrder.DescendingOrder)
+    # Equal volumes keep the order of the dataframe
+    assert [model.value(row, "label") for row in range(6)] == [4, 2, 5, 1, 3, 6]
+    assert model.value(0, "volume") == 7
+
+    # Flipping the direction gives the same order as sorting in that direction
+    model.sort(1, Qt.SortOrder.AscendingOrder)
+    assert [model.value(row, "label") for row in range(6)] == [6, 1, 3, 2, 5, 4]
+    model.sort(1, Qt.SortOrder.DescendingOrder)
+    assert [model.value(row, "label") for row in range(6)] == [4, 2, 5, 1, 3, 6]
+
+    # The sort is kept when the dataframe is replaced
+    model.set_dataframe(df.iloc[::-1])
+    assert [model.value(row, "label") for row in range(6)] == [4, 5, 2, 3, 1, 6]
+
+    model.sort(0, Qt.SortOrder.AscendingOrder)
+    assert [model.value(row, "label") for row in range(6)] == [1, 2, 3, 4, 5, 6]
+    assert [model.value(row, "volume") for row in range(6)] == [2, 5, 2, 7, 5, 1]
+
+
+def test_table_view_selection_follows_sort(qtbot):
+    model = _PropertiesTableModel(["label", "volume"])
+    view = QTableView()
+    qtbot.addWidget(view)
+    view.setModel(model)
+    view.setSortingEnabled(True)
+    model.set_dataframe(pd.DataFrame({"label": [1, 2, 3, 4], "volume": [3, 9, 1, 5]}))
+
+    view.sortByColumn(1, Qt.SortOrder.DescendingOrder)
+    view.selectRow(1)
+    assert model.value(view.currentIndex().row(), "label") == 4
+
+    view.sortByColumn(0, Qt.SortOrder.AscendingOrder)
+    assert model.value(view.currentIndex().row(), "label") == 4
+    assert [model.value(index.row(), "label") for index in view.selectionModel().selectedRows()] == [4]
+
+    # Flipping the direction
+    view.sortByColumn(0, Qt.SortOrder.DescendingOrder)
+    assert model.value(view.currentIndex().row(), "label") == 4
+    assert [model.value(index.row(), "label") for index in view.selectionModel().selectedRows()] == [4]
+
+
+def test_table_updated_after_edit_of_unselected_layer(make_napari_viewer, qtbot):
+    viewer = make_napari_viewer()
+
+    test_labels = np.zeros((20, 50, 60), dtype=np.uint16)
+    test_labels[2:5, 3:10, 4:20] = 1
+    layer_a = viewer.add_labels(test_labels, name="a")
+
+    my_widget = TableWidget(viewer)
+    qtbot.waitUntil(lambda: my_widget.df is not None)
+
+    layer_b = viewer.add_labels(test_labels.copy(), name="b")
+    qtbot.waitUntil(lambda: my_widget.selected_labels_layer is layer_b and my_widget._table.isEnabled())
+
+    layer_a.paint((12, 30, 30), 7)
+
+    viewer.layers.selection.active = layer_a
+    qtbot.waitUntil(lambda: my_widget.df is not None and 7 in my_widget.df["label"].tolist())
+    _assert_table_matches_labels(my_widget.df, layer_a.data)
+
+
+def test_table_updated_on_undo(make_napari_viewer, qtbot):
+    viewer = make_napari_viewer()
+
+    test_labels = np.zeros((20, 50, 60), dtype=np.uint16)
+    test_labels[2:5, 3:10, 4:20] = 1
+    layer = viewer.add_labels(test_labels)
+
+    my_widget = TableWidget(viewer)
+    qtbot.waitUntil(lambda: my_widget.df is not None)
+    initial_df = my_widget.df
+
+    layer.fill((3, 8, 15), 4)
+    qtbot.waitUntil(lambda: 4 in my_widget.df["label"].tolist())
+
+    layer.undo()
+    qtbot.waitUntil(lambda: 4 not in my_widget.df["label"].tolist())
+    _assert_table_matches_labels(my_widget.df, layer.data)
+    assert my_widget.df["volume"].tolist() == initial_df["volume"].tolist()
 
+    # Undone while another layer is selected
+    layer.redo()
+    qtbot.waitUntil(lambda: 4 in my_widget.df["label"].tolist())
+    other_layer = viewer.add_labels(test_labels.copy())
+    qtbot.waitUntil(lambda: my_widget.selected_labels_layer is other_layer)
+    layer.undo()
+    viewer.layers.selection.active = layer
+    qtbot.waitUntil(lambda: my_widget.df is not None and 4 not in my_widget.df["label"].tolist())
+    _assert_table_matches_labels(my_widget.df, layer.data)
@@ -1,27 +1,345 @@
+import weakref
+
 import napari
 import napari.layers
 import napari.layers.labels
 import numpy as np
 import pandas as pd
-import skimage.measure
+import scipy.ndimage
+from napari.qt.threading import create_worker
+from qtpy.QtCore import QAbstractTableModel, QModelIndex, Qt, QTimer
 from qtpy.QtWidgets import (
     QGridLayout, 
     QWidget, 
-    QTableWidget, 
-    QTableWidgetItem,
+    QTableView,
     QCheckBox,
     QLabel,
     QFileDialog,
     QPushButton,
 )
 
+
+def _as_int_labels(labels):
+    """Return the labels as an integer array, without copying integer inputs."""
+    labels = np.asarray(labels)
+    if np.issubdtype(labels.dtype, np.integer):
+        return labels
+
+    return np.ascontiguousarray(labels, dtype=np.int32)
+
+
+def _region_properties(labels):
+    """Compute the label, area and bbox of each object of a 3D integer labels array.
+
+    These are the only properties consumed by the UI: the table shows `label` and `area`,
+    and `bbox` is used to focus the view on the clicked label.
+
+    Equivalent to `regionprops_table(labels, properties=["label", "area", "bbox"])`, using one pass of
+    `np.bincount` for the areas and one of `scipy.ndimage.find_objects` for the bounding boxes
+    instead of measuring each region in Python.
+    """
+    if np.issubdtype(labels.dtype, np.signedinteger) and labels.min() < 0:
+        labels = np.maximum(labels, 0)  # Negative values are background, as in regionprops
+
+    max_label = int(labels.max())
+
+    flat_labels = labels.ravel()
+    if flat_labels.dtype == np.uint64:
+        flat_labels = flat_labels.astype(np.intp)  # Not safely castable for bincount
+    areas = np.bincount(flat_labels, minlength=max_label + 1)
+    present_labels = np.flatnonzero(areas[1:]) + 1
+
+    slices = scipy.ndimage.find_objects(labels, max_label)
+    bboxes = np.array(
+        [
+            [s.start for s in slices[label - 1]] + [s.stop for s in slices[label - 1]]
+            for label in present_labels
+        ],
+        dtype=int,
+    ).reshape(-1, 6)
+
+    properties = {"label": present_labels, "area": areas[present_labels]}
+    for k in range(6):
+        properties[f"bbox-{k}"] = bboxes[:, k]
+
+    return properties
+
+
+# Labels arrays with more voxels than this are measured on the GPU when cuCIM is installed
+_GPU_MIN_SIZE = 2**25
+
+
+def _gpu_region_properties(labels):
+    """GPU version of `_region_properties` using cuCIM, or None if cuCIM or a CUDA device is not available."""
+    try:
+        import cupy as cp
+        import cucim.skimage.measure
+    except ImportError:
+        return
+
+    if not cp.cuda.is_available():
+        return
+
+    try:
+        properties = cucim.skimage.measure.regionprops_table(
+            cp.asarray(labels), properties=["label", "area", "bbox"]
+        )
+        return {key: cp.asnumpy(values) for key, values in properties.items()}
+    except Exception:
+        # A broken driver, a volume too large for the device memory, kernels that cannot be
+        # compiled (no NVRTC)... The CPU version is always available, so fall back on any error
+        return
+
+
+def _sort_by_volume(df):
+    """Sort the rows by decreasing volume, and equal volumes by label."""
+    order = np.lexsort((df["label"].to_numpy(), -df["volume"].to_numpy()))
+
+    return df.iloc[order]
+
+
+def _stable_argsort(values, descending=False):
+    """Return the indices sorting `values`, keeping the existing order of equal values in both directions."""
+    if not descending:
+        return np.argsort(values, kind="stable")
+
+    # Reversing a stable ascending sort would put equal values in reverse order
+    return (len(values) - 1 - np.argsort(values[::-1], kind="stable"))[::-1]
+
+
+def _reversed_order(sorted_values):
+    """Return the indices reversing sorted values in O(n), keeping the existing order of equal values.
+
+    This is the order a stable sort in the other direction would give, without comparing values.
+    """
+    run_starts = np.flatnonzero(np.r_[True, sorted_values[1:] != sorted_values[:-1]])
+    run_lengths = np.diff(np.r_[run_starts, len(sorted_values)])
+    run_starts, run_lengths = run_starts[::-1], run_lengths[::-1]
+    # Runs of equal values in reverse order, each run in its existing order
+    run_offsets = np.r_[0, np.cumsum(run_lengths)[:-1]]
+
+    return np.repeat(run_starts - run_offsets, run_lengths) + np.arange(len(sorted_values))
+
+
+def _paint_extent(atom, shape):
+    """Return the bounding box [box_min, box_max[ and the label values involved in a paint operation.
+
+    Supports both the (indices, old values, new values) history atoms of napari Labels layers
+    and the mask-based atoms that describe the edit by a `slice_key` bounding box.
+    """
+    slice_key = getattr(atom, "slice_key", None)
+    if slice_key is not None:
+        slice_key = tuple(slice_key) + (slice(None),) * (len(shape) - len(slice_key))
+        bounds = [axis_slice.indices(n)[:2] for axis_slice, n in zip(slice_key, shape)]
+        box_min = np.array([start for start, _ in bounds])
+        box_max = np.array([stop for _, stop in bounds])
+        old_values, new_values = atom.old_values, atom.new_value
+    else:
+        indices, old_values, new_values = atom
+        box_min = np.array([np.min(axis_indices) for axis_indices in indices])
+        box_max = np.array([np.max(axis_indices) + 1 for axis_indices in indices])
+
+    changed_labels = set(np.unique(old_values).tolist()) | set(np.unique(new_values).tolist())
+
+    return box_min, box_max, changed_labels
+
+
+def _update_properties(df, labels, changed_labels, box_min, box_max):
+    """Recompute the rows of `changed_labels` in `df` after an edit of the 3D `labels` array.
+
+    The edited voxels must lie inside the box [box_min, box_max[. Each changed label is then
+    measured in the union of that box with its previous bounding box, instead of in the full volume.
+    """
+    changed_labels = [label for label in changed_labels if label > 0]
+    is_changed = df["label"].isin(changed_labels).to_numpy()
+    previous_bboxes = dict(
+        zip(
+            df["label"].values[is_changed].tolist(),
+            df[[f"bbox-{k}" for k in range(6)]].to_numpy(dtype=int)[is_changed],
+        )
+    )
+
+    new_rows = []
+    for label in changed_labels:
+        lo, hi = np.asarray(box_min), np.asarray(box_max)
+        if label in previous_bboxes:
+            lo = np.minimum(lo, previous_bboxes[label][:3])
+            hi = np.maximum(hi, previous_bboxes[label][3:])
+
+        crop = np.asarray(labels[tuple(slice(a, b) for a, b in zip(lo, hi))])
+        coords = np.nonzero(crop == label)
+        if len(coords[0]) == 0:
+            continue  # The label has been fully erased
+
+        row = {"label": label, "volume": len(coords[0])}
+        for k, axis_coords in enumerate(coords):
+            row[f"bbox-{k}"] = lo[k] + axis_coords.min()
+            row[f"bbox-{k + 3}"] = lo[k] + axis_coords.max() + 1
+        new_rows.append(row)
+
+    df = df[~is_changed]
+    if new_rows:
+        df = pd.concat([df, pd.DataFrame(new_rows, columns=df.columns)], ignore_index=True)
+
+    return _sort_by_volume(df)
+
+
+def _history_version(layer, n_edits_back=0):
+    """Return an identifier of the last edit (or of an older one) in the undo history of a Labels layer.
+
+    It changes on every paint, undo and redo, including undo and redo that only refresh the layer
+    without emitting a `paint` or `data` event.
+    """
+    history = layer._undo_history
+    return id(history[-1 - n_edits_back]) if len(history) > n_edits_back else None
+
+
+# Events of the Labels layers with cached properties and the TableWidget methods handling them
+_LAYER_EVENTS = (
+    ("data", "_on_labels_data_changed"),
+    ("paint", "_on_labels_painted"),
+    ("set_data", "_on_labels_refreshed"),
+)
+
+
+class _PropertiesTableModel(QAbstractTableModel):
+    """Read-only table model showing columns of a dataframe.
+
+    Qt only requests the cells it displays, so the values are formatted lazily for the
+    visible rows instead of creating an item for every cell of the table. Rows are also
+    exposed to the view in batches, as the user scrolls down. Sorting reorders the column
+    arrays and is kept when the dataframe is replaced.
+    """
+
+    fetch_size = 500
+
+    def __init__(self, columns, parent=None):
+        super().__init__(parent)
+        self._columns = list(columns)
+        self._values = [np.empty(0) for _ in self._columns]
+        self._n_fetched_rows = 0
+        self._sort_column = None
+        self._sort_order = Qt.SortOrder.AscendingOrder
+
+    def set_dataframe(self, df):
+        self.beginResetModel()
+        if df is None:
+            self._values = [np.empty(0) for _ in self._columns]
+        else:
+            self._values = [df[column].to_numpy() for column in self._columns]
+        self._sort_values()
+        self._n_fetched_rows = min(self.fetch_size, len(self._values[0]))
+        self.endResetModel()
+
+    def value(self, row, column):
+        """Return the raw value of a column (by name) in a row of the table."""
+        return self._values[self._columns.index(column)][row]
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        self.layoutAboutToBeChanged.emit()
+        if column == self._sort_column and order != self._sort_order:
+            # Only the direction changed: reversing the rows is enough
+            reversed_rows = _reversed_order(self._values[column])
+            self._values = [values[reversed_rows] for values in self._values]
+            self._sort_order = order
+            self._move_persistent_indexes(reversed_rows)
+        else:
+            self._sort_column = column
+            self._sort_order = order
+            sorted_rows = self._sort_values()
+            if sorted_rows is not None:
+                self._move_persistent_indexes(sorted_rows)
+        self.layoutChanged.emit()
+
+    def _sort_values(self):
+        """Sort the rows by the sort column and return their previous indices, or None if they were in order."""
+        if self._sort_column is None:
+            return
+
+        keys = self._values[self._sort_column]
+        descending = self._sort_order == Qt.SortOrder.DescendingOrder
+        if np.all(keys[:-1] >= keys[1:] if descending else keys[:-1] <= keys[1:]):
+            return  # Already in order, e.g. the volumes of a freshly computed dataframe
+
+        order = _stable_argsort(keys, descending)
+        self._values = [values[order] for values in self._values]
+
+        return order
+
+    def _move_persistent_indexes(self, moved_rows):
+        """Follow a reordering of the rows (row i now holds previous row `moved_rows[i]`) in the persistent
+        indexes, so that the current and selected cells of the view stay on the same labels.
+        """
+        new_rows = np.empty_like(moved_rows)
+        new_rows[moved_rows] = np.arange(len(moved_rows))
+
+        old_indexes = self.persistentIndexList()
+        # Rows moved beyond the fetched ones get an invalid index, e.g. the selection is cleared
+        new_indexes = [self.index(int(new_rows[index.row()]), index.column()) for index in old_indexes]
+        self.changePersistentIndexList(old_indexes, new_indexes)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._n_fetched_rows
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._n_fetched_rows < len(self._values[0])
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+
+        n_rows = min(self.fetch_size, len(self._values[0]) - self._n_fetched_rows)
+        self.beginInsertRows(QModelIndex(), self._n_fetched_rows, self._n_fetched_rows + n_rows - 1)
+        self._n_fetched_rows += n_rows
+        self.endInsertRows()
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._columns)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+
+        return str(self._values[index.column()][index.row()])
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self._columns[section]
+
+        return super().headerData(section, orientation, role)
+
+
 class TableWidget(QWidget):
     def __init__(self, napari_viewer):
         super().__init__()
         self.viewer = napari_viewer
         self.selected_labels_layer = None
         self.df = None
+        # Row index of each label in the table and (n_labels, 6) bounding boxes, aligned with `df`
+        self._label_rows = {}
+        self._bbox_array = None
         self.current_time = None
+        # Region properties of each labels layer, indexed by time frame. Weakly keyed so
+        # that the cache does not keep deleted layers (and their data) alive.
+        self._props_cache = weakref.WeakKeyDictionary()
+        # Paint operations (indices, old values, new values) not yet applied to the cached properties
+        self._pending_paint = []
+        # Incremented on every refresh; results of older background computations are discarded
+        self._props_request = 0
+        # Label to focus on once the table of the new time frame is available
+        self._focus_label_after_update = None
+
+        # Refresh the table once the user pauses painting rather than on every brush stroke
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(200)
+        self._refresh_timer.timeout.connect(self._on_refresh_timeout)
+
+        # Likewise, refresh once the time slider settles rather than for every frame it crosses
+        self._time_step_timer = QTimer(self)
+        self._time_step_timer.setSingleShot(True)
+        self._time_step_timer.setInterval(50)
+        self._time_step_timer.timeout.connect(self._on_refresh_timeout)
 
         self.setLayout(QGridLayout())
 
@@ -34,14 +352,14 @@ class TableWidget(QWidget):
         save_button.clicked.connect(lambda _: self._save_csv())
         self.layout().addWidget(save_button, 1, 0, 1, 2)
 
-        self._table = QTableWidget()
-        self._table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
-        self._table.setColumnCount(2)
-        self._table.setRowCount(1)
+        self._table = QTableView()
+        self._table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
+        self._table.setModel(_PropertiesTableModel(["label", "volume"], self))
         self._table.setColumnWidth(0, 30)
         self._table.setColumnWidth(1, 120)
-        self._table.setHorizontalHeaderItem(0, QTableWidgetItem("label"))
-        self._table.setHorizontalHeaderItem(1, QTableWidgetItem("volume"))
+        # Sorted by volume (biggest object on top) until the user clicks another column header
+        self._table.horizontalHeader().setSortIndicator(1, Qt.SortOrder.DescendingOrder)
+        self._table.setSortingEnabled(True)
         self._table.clicked.connect(self._clicked_table)
 
         self.layout().addWidget(self._table, 2, 0, 1, 2)
@@ -52,6 +370,7 @@ class TableWidget(QWidget):
         self.viewer.layers.events.inserted.connect(
             lambda e: self._on_layer_selection_changed(None)
         )
+        self.viewer.layers.events.removed.connect(self._on_layer_removed)
         self._on_layer_selection_changed(None)
 
     def _on_layer_selection_changed(self, event):
@@ -60,22 +379,134 @@ class TableWidget(QWidget):
         else:
             selected_layer = event.source.active
 
-        if isinstance(self.selected_labels_layer, napari.layers.Labels):
-            self.selected_labels_layer.events.paint.disconnect(self.update_table_content)
-            self.selected_labels_layer.events.data.disconnect(self.update_table_content)
-            if self.selected_labels_layer.data.ndim == 4:
-                self.viewer.dims.events.current_step.disconnect(self.handle_time_axis_changed)
+        # Adding a layer emits both `inserted` and a selection change; nothing to do if the layer is the same
+        if selected_layer is self.selected_labels_layer:
+            return
+
+        self._apply_pending_paint()  # Edits of the previously selected layer
+        self._rewire(self.selected_labels_layer, selected_layer)
+        self.selected_labels_layer = selected_layer
 
-        if isinstance(selected_layer, napari.layers.Labels):
-            selected_layer.events.data.connect(self.update_table_content)
-            selected_layer.events.paint.connect(self.update_table_content)
-            if selected_layer.data.ndim == 4:
+        self.update_table_content()
+
+    def _rewire(self, old_layer, new_layer):
+        """Connect the events of the newly selected layer and move the time axis connection to it.
+
+        The layer events stay connected once the layer is deselected, so that its cached
+        properties are invalidated when it is edited in the meantime, until it is removed.
+        """
+        if isinstance(old_layer, napari.layers.Labels) and old_layer.data.ndim == 4:
+            self.viewer.dims.events.current_step.disconnect(self.handle_time_axis_changed)
+
+        if isinstance(new_layer, napari.layers.Labels):
+            for event_name, slot_name in _LAYER_EVENTS:
+                getattr(new_layer.events, event_name).connect(getattr(self, slot_name))
+            if new_layer.data.ndim == 4:
                 self.viewer.dims.events.current_step.connect(self.handle_time_axis_changed)
 
-        self.selected_labels_layer = selected_layer
+    def _on_layer_removed(self, event):
+        layer = event.value
+        self._props_cache.pop(layer, None)
+        if isinstance(layer, napari.layers.Labels):
+            for event_name, slot_name in _LAYER_EVENTS:
+                getattr(layer.events, event_name).disconnect(getattr(self, slot_name))
+
+    def _layer_cache(self, layer):
+        """Return the cached properties of each time frame of a layer, reset if its data was edited or replaced."""
+        data, version, frames = self._props_cache.get(layer, (None, None, None))
+        if data is not layer.data or version != _history_version(layer):
+            frames = {}
+            self._props_cache[layer] = (layer.data, _history_version(layer), frames)
+
+        return frames
+
+    def _on_labels_data_changed(self, event):
+        """Invalidate the cached properties of an edited layer and schedule a table refresh if it is selected."""
+        layer = event.source
+        self._props_cache.pop(layer, None)
+        if layer is not self.selected_labels_layer:
+            return  # Recomputed when the layer is selected again
+
+        self._pending_paint = []
+        self._props_request += 1  # Results computed from the previous data are stale
+        self._refresh_timer.start()
+
+    def _on_labels_painted(self, event):
+        """Queue the painted voxels to update the cached properties of the affected labels only."""
+        layer = event.source
+        atoms = getattr(event, "value", None)
+        data, version, frames = self._props_cache.get(layer, (None, None, None))
+        if (
+            layer is not self.selected_labels_layer
+            or not isinstance(atoms, (list, tuple))
+            or data is not layer.data
+            or version != _history_version(layer, n_edits_back=1)
+        ):
+            # Not displayed, no description of the painted voxels, or the cache missed
+            # an earlier edit: recompute everything
+            self._on_labels_data_changed(event)
+            return
 
+        # Up to date with this edit once the pending paint operations are applied
+        self._props_cache[layer] = (data, _history_version(layer), frames)
+        self._pending_paint.extend(atoms)
+        self._props_request += 1
+        self._refresh_timer.start()
+
+    def _on_labels_refreshed(self, event):
+        """Invalidate the cached properties of a layer edited without a `paint` or `data` event (undo, redo)."""
+        layer = event.source
+        data, version, _ = self._props_cache.get(layer, (None, None, None))
+        if data is layer.data and version != _history_version(layer):
+            self._on_labels_data_changed(event)
+
+    def _on_refresh_timeout(self):
+        self._apply_pending_paint()
         self.update_table_content()
 
+    def _apply_pending_paint(self):
+        """Update the cached properties of the selected layer with the pending paint operations."""
+        atoms = self._pending_paint
+        self._pending_paint = []
+        if not atoms or not isinstance(self.selected_labels_layer, napari.layers.Labels):
+            return
+
+        layer = self.selected_labels_layer
+        shape = layer.data.shape
+
+        # Edited box and label values involved, for each time frame
+        edits = {}
+        try:
+            for atom in atoms:
+                box_min, box_max, changed_labels = _paint_extent(atom, shape)
+                if len(shape) == 2:
+                    box_min, box_max = np.r_[0, box_min], np.r_[1, box_max]
+                # The spatial box is the last 3 axes, the first axis of 4D layers is time
+                for frame in [None] if len(shape) < 4 else range(box_min[0], box_max[0]):
+                    frame_min, frame_max, frame_labels = box_min[-3:], box_max[-3:], changed_labels
+                    if frame in edits:
+                        prev_min, prev_max, prev_labels = edits[frame]
+                        frame_min = np.minimum(frame_min, prev_min)
+                        frame_max = np.maximum(frame_max, prev_max)
+                        frame_labels = frame_labels | prev_labels
+                    edits[frame] = (frame_min, frame_max, frame_labels)
+        except (AttributeError, TypeError, ValueError):
+            # Unexpected paint event payload
+            self._props_cache.pop(layer, None)
+            return
+
+        labels = layer.data
+        if labels.ndim == 2:
+            labels = labels[None]
+
+        layer_cache = self._layer_cache(layer)
+        for frame, (box_min, box_max, changed_labels) in edits.items():
+            df = layer_cache.get(frame)
+            if df is None:
+                continue  # Computed from scratch when the frame is displayed
+            frame_labels = labels if frame is None else labels[frame]
+            layer_cache[frame] = _update_properties(df, frame_labels, changed_labels, box_min, box_max)
+
     @property
     def axes(self):
         if self.viewer.dims.ndisplay == 3:
@@ -105,24 +536,20 @@ class TableWidget(QWidget):
         if self.selected_labels_layer is None:
             return
         
-        self.handle_selected_table_label_changed(self.df["label"].values[self._table.currentRow()])
+        self.handle_selected_table_label_changed(
+            self._table.model().value(self._table.currentIndex().row(), "label")
+        )
 
     def handle_selected_table_label_changed(self, selected_table_label):
 
-        if not selected_table_label in self.df['label'].unique():
+        row = self._label_rows.get(selected_table_label)
+        if row is None:
             print(f"Label {selected_table_label} is not present.")
             return
 
         self.selected_labels_layer.selected_label = selected_table_label
 
-        sub_df = self.df[self.df['label'] == selected_table_label]
-
-        x0 = int(sub_df['bbox-0'].values[0])
-        x1 = int(sub_df['bbox-3'].values[0])
-        y0 = int(sub_df['bbox-1'].values[0])
-        y1 = int(sub_df['bbox-4'].values[0])
-        z0 = int(sub_df['bbox-2'].values[0])
-        z1 = int(sub_df['bbox-5'].values[0])
+        x0, y0, z0, x1, y1, z1 = self._bbox_array[row]
 
         label_size = max(x1 - x0, y1 - y0, z1 - z0)
 
@@ -142,9 +569,7 @@ class TableWidget(QWidget):
                 current_center[1] = centers[self.axes[1]]
                 current_center[2] = centers[self.axes[2]]
                 # In 3D, also adjust the current step
-                current_step = np.array(self.viewer.dims.current_step)[
-                    self.axes
-                ]
+                current_step = [self.viewer.dims.current_step[axis] for axis in self.axes]
                 current_step[self.axes[0]] = int(centers[self.axes[0]])
                 self.viewer.dims.current_step = tuple(current_step)
 
@@ -152,9 +577,7 @@ class TableWidget(QWidget):
                 # TODO - This is very experimental (probably not working when layers are transposed)
                 current_center[1] = centers[self.axes[2]-1]
                 current_center[2] = centers[self.axes[3]-1]
-                current_step = np.array(self.viewer.dims.current_step)[
-                    self.axes
-                ]
+                current_step = [self.viewer.dims.current_step[axis] for axis in self.axes]
                 current_step[self.axes[1]] = int(centers[self.axes[1]-1])
                 self.viewer.dims.current_step = tuple(current_step)
 
@@ -162,58 +585,109 @@ class TableWidget(QWidget):
 
         self.viewer.camera.zoom = max(3 - label_size * 0.005, 1.0)
 
-    def updated_content_2D_or_3D(self, labels):
-        """Compute volumes and update the table UI in the 2D and 3D cases."""
-        properties = skimage.measure.regionprops_table(
-            labels, properties=["label", "area", "bbox"]
-        )
-        self.df = pd.DataFrame.from_dict(properties)
-        self.df.rename(columns={"area": "volume"}, inplace=True)
-        self.df.sort_values(by="volume", ascending=False, inplace=True)
-
-        # Regenerate the table UI
-        self._table.clear()
-        self._table.setRowCount(len(self.df))
-        self._table.setHorizontalHeaderItem(0, QTableWidgetItem("label"))
-        self._table.setHorizontalHeaderItem(1, QTableWidgetItem("volume"))
-
-        k = 0
-        for _, (lab, vol) in self.df[["label", "volume"]].iterrows():
-            self._table.setItem(k, 0, QTableWidgetItem(str(lab)))
-            self._table.setItem(k, 1, QTableWidgetItem(str(vol)))
-            k += 1
+    def _compute_properties(self, labels):
+        """Compute the label, volume and bounding box of each object in a 3D labels array.
+
+        Runs in a worker thread. Returns None if the labels array is empty.
+        """
+        labels = _as_int_labels(labels)
+        if not labels.any():
+            return
+
+        properties = None
+        if labels.size > _GPU_MIN_SIZE:
+            properties = _gpu_region_properties(labels)
+        if properties is None:
+            properties = _region_properties(labels)
+        properties["area"] = np.asarray(properties["area"], dtype=int)  # Float areas on the GPU
+        df = pd.DataFrame.from_dict(properties)
+        df.rename(columns={"area": "volume"}, inplace=True)
+
+        return _sort_by_volume(df)
+
+    def _update_table_ui(self):
+        """Regenerate the table UI from the current dataframe."""
+        self._table.model().set_dataframe(self.df)
 
     def handle_time_axis_changed(self, event):
         current_time = event.value[0]
         if (current_time != self.current_time) | (self.current_time is None):
             self.current_time = current_time
-            current_selected_label = self.selected_labels_layer.selected_label
-            self.update_table_content()
             if self.follow_objects_checkbox.isChecked():
-                self.handle_selected_table_label_changed(current_selected_label)
+                self._focus_label_after_update = self.selected_labels_layer.selected_label
+            self._props_request += 1  # The frame being computed is not the displayed one anymore
+            self._time_step_timer.start()
 
     def update_table_content(self):
+        self._refresh_timer.stop()
+        self._time_step_timer.stop()
+        self._props_request += 1
+        self._table.setEnabled(True)
+
         if not isinstance(self.selected_labels_layer, napari.layers.Labels):
-            self._table.clear()
-            self._table.setRowCount(1)
-            self._table.setColumnWidth(0, 30)
-            self._table.setColumnWidth(1, 120)
-            self._table.setHorizontalHeaderItem(0, QTableWidgetItem("label"))
-            self._table.setHorizontalHeaderItem(1, QTableWidgetItem("volume"))
+            self._focus_label_after_update = None
+            self.df = None
+            self._label_rows = {}
+            self._bbox_array = None
+            self._update_table_ui()
             return
 
         labels = self.selected_labels_layer.data
+        frame = None
 
         if len(labels.shape) == 2:
             labels = labels[None]  # Add an extra dimension in the 2D case
 
         elif len(labels.shape) == 4:
-            labels = labels[self.viewer.dims.current_step[0]]
+            frame = self.viewer.dims.current_step[0]
+            labels = labels[frame]
+
+        # Only recompute the properties when the labels have changed since the last pass
+        layer_cache = self._layer_cache(self.selected_labels_layer)
+        df = layer_cache.get(frame)
+        if df is not None:
+            self._set_properties(df)
+            return
+
+        # Compute the properties in a background thread to keep the viewer responsive
+        request = self._props_request
+        self._table.setEnabled(False)  # Greyed out until the new properties are shown
+        create_worker(
+            self._compute_properties,
+            labels,
+            _connect={
+                "returned": lambda df: self._on_properties_computed(layer_cache, frame, request, df),
+                "finished": lambda: self._on_properties_worker_finished(request),
+            },
+        )
+
+    def _on_properties_computed(self, layer_cache, frame, request, df):
+        if request != self._props_request:
+            return  # The labels, layer or time frame have changed in the meantime
 
-        if labels.sum() == 0:
+        if df is None:
+            self._focus_label_after_update = None
             return
 
-        self.updated_content_2D_or_3D(labels)
+        layer_cache[frame] = df  # Dropped with the cache entry if the labels were edited since
+        self._set_properties(df)
+
+    def _on_properties_worker_finished(self, request):
+        if request == self._props_request:
+            self._table.setEnabled(True)
+
+    def _set_properties(self, df):
+        # Cache hits return the same dataframe, e.g. when the selection events fire again
+        if df is not self.df:
+            self.df = df
+            self._label_rows = dict(zip(df["label"].tolist(), range(len(df))))
+            self._bbox_array = df[[f"bbox-{k}" for k in range(6)]].to_numpy(dtype=int)
+            self._update_table_ui()
+
+        if self._focus_label_after_update is not None:
+            selected_label = self._focus_label_after_update
+            self._focus_label_after_update = None
+            self.handle_selected_table_label_changed(selected_label)
 
     def _save_csv(self):
         if self.df is None: